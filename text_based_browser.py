@@ -2,20 +2,50 @@
 # TEXT BASED BROWSER
 # tags: [web_scraping, HTTP requests, colored terminal text]
 #
-# This program extracts and saves the content of webpages in markdown format
+# This program extracts and saves the content of webpages in markdown format.
+# It can also crawl a site from seed urls with the command
+#   crawl [--any-domain] <depth> <url> [<url> ...]
+# which stays on the domains of the seed urls unless --any-domain is given.
+# An interrupted crawl is resumed with a bare "crawl" command, or thrown
+# away with "crawl discard" before starting a new one. Saved pages
+# are archived in compressed segments and can be searched with
+#   search <words or "a phrase">
+# Saving a page again leaves its old copy in the archive until the archive
+# is rewritten with the "compact" command.
 # #########################################################################
 
 
 import os
 import sys
+import time
+import json
+import math
+import base64
+import hashlib
+import zlib
 
-from collections import deque
+from collections import Counter, deque
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+from urllib.robotparser import RobotFileParser
 import re
 import requests
 from bs4 import BeautifulSoup
 from colorama import Fore
 
 
+REQUEST_TIMEOUT = 10                    # seconds to wait for a server
+CRAWL_DELAY = 1.0                       # seconds between hits on one host
+CHECKPOINT_FILE = ".crawl_frontier.json"
+CHECKPOINT_INTERVAL = 50                # pages between frontier checkpoints
+BLOOM_THRESHOLD = 100000                # switch to a bloom filter past this
+SEGMENT_SIZE = 64 * 1024 * 1024         # bytes per page store segment
+INDEX_FILE = "pages.idx"
+INDEX_HEADER_SIZE = 4                   # bytes of length before a record
+SKIPPED_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.svg', '.ico',
+                      '.pdf', '.zip', '.gz', '.tar', '.mp3', '.mp4',
+                      '.avi', '.mov', '.css', '.js', '.xml', '.exe')
+
+
 def url_validation(tb_url: str) -> str:
     ''' Check that the user provided a valid url '''
 
@@ -40,10 +70,21 @@ def url_validation(tb_url: str) -> str:
         return "invalid"
 
 
-def web_scrape(url_page: str):
-    '''Extract the text from the url page'''
+def web_scrape(url_page: str, hrefs: list = None, echo: bool = True):
+    '''Extract the text from the url page
+
+    When a list is passed as hrefs, the absolute targets of the links on
+    the page are appended to it for the crawler, and anything other than
+    an html page is skipped without downloading its body.
+    '''
     # Make HTTP GET request
-    response = requests.get(url_page)
+    crawling = hrefs is not None
+    response = requests.get(url_page, timeout=REQUEST_TIMEOUT,
+                            stream=crawling)
+    if crawling and (not response.ok or "text/html" not in
+                     response.headers.get("content-type", "").lower()):
+        response.close()
+        return ""                           # nothing to crawl on this page
     page_content = response.content
     # Use beautiful soup to parse the html and read page body
     soup = BeautifulSoup(markup=page_content,
@@ -53,6 +94,11 @@ def web_scrape(url_page: str):
     for link in soup.find_all('a'):
         if len(link.get_text(strip=True)) != 0:
             links.append(link.get_text(" ", strip=True))
+        if hrefs is not None and link.get("href"):
+            try:
+                hrefs.append(urljoin(response.url, link["href"]))
+            except ValueError:
+                pass                        # skip malformed links
     # Get the text from the entire page
     html = []
     for html_tag in soup.find_all():
@@ -61,18 +107,495 @@ def web_scrape(url_page: str):
                 html_tag.name in ['p', 'a', 'ul', 'ol',  'h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
             html.append(html_tag.get_text(" ", strip=True))
 
-    for phrase in html:
-        if phrase in set(links):
-            print(Fore.BLUE + phrase)
-        else:
-            print(Fore.BLACK + phrase)
+    if echo:
+        link_texts = set(links)
+        for phrase in html:
+            if phrase in link_texts:
+                print(Fore.BLUE + phrase)
+            else:
+                print(Fore.BLACK + phrase)
     return " ".join(html)                   # returns page content
 
 
+def tokenize(text: str) -> list:
+    ''' Split text into lower case words for the search index '''
+    return re.findall(r'\w+', text.lower())
+
+
+class PageStore:
+    ''' Compressed archive of saved pages with a full text search index
+
+    Pages are appended zlib compressed to numbered segment files. Every save
+    also appends a compressed record to the index file holding the page
+    location and how often each of its words occurs, so the index is
+    updated incrementally and is rebuilt in memory by replaying that file
+    on startup. Word positions are not indexed: phrases are checked by
+    reading the candidate pages. A page that is saved again keeps its old
+    copy on disk until compact is called.
+    '''
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        # url -> (doc, segment, offset, length)
+        self.pages = {}
+        self.urls = {}                      # doc -> url
+        self.postings = {}                  # word -> {doc: count}
+        self.segment = 0
+        self.next_doc = 0
+        self._load()
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, f"segment_{segment:05d}.dat")
+
+    def _load(self) -> None:
+        index_path = os.path.join(self.directory, INDEX_FILE)
+        if not os.path.exists(index_path):
+            return
+        with open(index_path, "rb+") as index_file:
+            complete = 0                    # end of the last whole record
+            while True:
+                header = index_file.read(INDEX_HEADER_SIZE)
+                length = int.from_bytes(header, "big")
+                record = index_file.read(length)
+                if len(header) < INDEX_HEADER_SIZE or len(record) < length:
+                    break                   # end of file or a crash
+                complete += INDEX_HEADER_SIZE + length
+                try:
+                    entry = json.loads(zlib.decompress(record))
+                except (zlib.error, ValueError):
+                    continue
+                self._index(entry)
+                self.segment = max(self.segment, entry["segment"])
+            # cut off the partial record so the next save starts cleanly
+            index_file.truncate(complete)
+        while os.path.exists(self._segment_path(self.segment + 1)):
+            self.segment += 1
+
+    def _index(self, entry: dict) -> None:
+        doc, url = entry["doc"], entry["url"]
+        old = self.pages.get(url)
+        if old is not None:                 # the page was saved again
+            del self.urls[old[0]]
+        superseded = entry.get("superseded")
+        if superseded is not None:
+            # drop the old copy from the postings of every word it held
+            for word in superseded["words"]:
+                word_postings = self.postings.get(word, {})
+                word_postings.pop(superseded["doc"], None)
+                if not word_postings:
+                    self.postings.pop(word, None)
+        self.pages[url] = (doc, entry["segment"], entry["offset"],
+                           entry["length"])
+        self.urls[doc] = url
+        self.next_doc = max(self.next_doc, doc + 1)
+        for word, count in entry["words"].items():
+            self.postings.setdefault(word, {})[doc] = count
+
+    def _read(self, segment: int, offset: int, length: int) -> str:
+        with open(self._segment_path(segment), "rb") as segment_file:
+            segment_file.seek(offset)
+            return zlib.decompress(segment_file.read(length)).decode("UTF-8")
+
+    def _write(self, record: bytes) -> int:
+        ''' Append a compressed page to the current segment and return its
+        offset '''
+        segment_path = self._segment_path(self.segment)
+        if os.path.exists(segment_path) and \
+                os.path.getsize(segment_path) + len(record) > SEGMENT_SIZE:
+            self.segment += 1
+            segment_path = self._segment_path(self.segment)
+        with open(segment_path, "ab") as segment_file:
+            offset = segment_file.tell()
+            segment_file.write(record)
+        return offset
+
+    def _entry(self, doc: int, url: str, record: bytes,
+               page_text: str) -> dict:
+        ''' Write a page and return its record for the index file '''
+        offset = self._write(record)
+        return {"doc": doc, "url": url, "segment": self.segment,
+                "offset": offset, "length": len(record),
+                "words": Counter(tokenize(page_text))}
+
+    @staticmethod
+    def _pack(entry: dict) -> bytes:
+        ''' Compress an index record and prefix it with its length '''
+        record = zlib.compress(json.dumps(entry).encode("UTF-8"))
+        return len(record).to_bytes(INDEX_HEADER_SIZE, "big") + record
+
+    def add(self, url: str, page_text: str) -> int:
+        ''' Archive the text of a page and return its document number '''
+        url = normalize_url(url)
+        old = self.pages.get(url)
+        record = zlib.compress(page_text.encode("UTF-8"))
+        entry = self._entry(self.next_doc, url, record, page_text)
+        if old is not None:
+            # keep the words of the old copy in the index, so replaying it
+            # can drop them without reading the segments
+            entry["superseded"] = {
+                "doc": old[0],
+                "words": sorted(set(tokenize(self._read(*old[1:])))),
+            }
+        with open(os.path.join(self.directory, INDEX_FILE), "ab") \
+                as index_file:
+            index_file.write(self._pack(entry))
+        self._index(entry)
+        return entry["doc"]
+
+    def get(self, url: str) -> str:
+        ''' Return the archived text of a page '''
+        return self._read(*self.pages[normalize_url(url)][1:])
+
+    def compact(self) -> None:
+        ''' Rewrite the archive keeping only the latest save of each page '''
+        index_path = os.path.join(self.directory, INDEX_FILE)
+        old_segments = self.segment
+        # copy the live pages into fresh segments after the current ones, so
+        # the old archive stays valid until the new index replaces it
+        self.segment += 1
+        pages = {}
+        with open(index_path + ".tmp", "wb") as index_file:
+            for url, page in sorted(self.pages.items(),
+                                    key=lambda item: item[1][0]):
+                doc, segment, offset, length = page
+                with open(self._segment_path(segment), "rb") as segment_file:
+                    segment_file.seek(offset)
+                    record = segment_file.read(length)
+                page_text = zlib.decompress(record).decode("UTF-8")
+                entry = self._entry(doc, url, record, page_text)
+                index_file.write(self._pack(entry))
+                pages[url] = (doc, entry["segment"], entry["offset"],
+                              entry["length"])
+        os.replace(index_path + ".tmp", index_path)
+        self.pages = pages
+        for segment in range(old_segments + 1):
+            if os.path.exists(self._segment_path(segment)):
+                os.remove(self._segment_path(segment))
+
+    def _matches(self, words: list, docs: set = None) -> dict:
+        ''' Return {doc: hits} for the pages containing the words in order
+
+        Only the pages in docs are considered when it is given.
+        '''
+        postings = [self.postings.get(word, {}) for word in words]
+        if not all(postings):
+            return {}
+        # intersect starting from the rarest word to keep the work small
+        candidates = set(min(postings, key=len))
+        for word_postings in postings:
+            candidates.intersection_update(word_postings)
+        if docs is not None:
+            candidates.intersection_update(docs)
+        if len(words) == 1:
+            return {doc: postings[0][doc] for doc in candidates}
+        # positions are not indexed, so look for the phrase in the page
+        matches = {}
+        for doc in candidates:
+            page_words = tokenize(self._read(*self.pages[self.urls[doc]][1:]))
+            hits = sum(1 for start in range(len(page_words) - len(words) + 1)
+                       if page_words[start:start + len(words)] == words)
+            if hits:
+                matches[doc] = hits
+        return matches
+
+    def search(self, query: str) -> list:
+        ''' Return the urls of pages matching every word and quoted phrase
+
+        The pages with the most hits come first.
+        '''
+        phrases = [tokenize(phrase)
+                   for phrase in re.findall(r'"([^"]*)"', query)]
+        phrases += [[word]
+                    for word in tokenize(re.sub(r'"[^"]*"', " ", query))]
+        # match the single words first, so that only the pages containing
+        # all of them are read to check the phrases
+        phrases = sorted((phrase for phrase in phrases if phrase), key=len)
+        if not phrases:
+            return []
+        scores = None
+        for phrase in phrases:
+            matches = self._matches(phrase, scores)
+            if scores is None:
+                scores = matches
+            else:
+                scores = {doc: scores[doc] + hits
+                          for doc, hits in matches.items()}
+            if not scores:
+                return []
+        ranked = sorted(scores, key=lambda doc: (-scores[doc], doc))
+        return [self.urls[doc] for doc in ranked]
+
+
+def normalize_url(url: str) -> str:
+    ''' Reduce a url to a canonical form so that duplicates compare equal '''
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    # drop the default ports
+    if parts.port and not (scheme == "http" and parts.port == 80) and \
+            not (scheme == "https" and parts.port == 443):
+        host = f"{host}:{parts.port}"
+    path = re.sub(r'/{2,}', '/', parts.path) or "/"
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((scheme, host, path, query, ""))   # drop the fragment
+
+
+def url_host(url: str) -> str:
+    ''' Return the host of a url without the leading www. '''
+    try:
+        host = (urlsplit(url).hostname or "").lower()
+    except ValueError:
+        return ""                           # malformed url
+    return host[4:] if host.startswith("www.") else host
+
+
+class BloomFilter:
+    ''' Fixed size set of strings with no false negatives '''
+
+    def __init__(self, capacity: int, error_rate: float = 0.001,
+                 bits: bytes = None):
+        # size the filter for the expected number of items
+        self.size = max(8, int(-capacity * math.log(error_rate)
+                               / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray(bits) if bits else bytearray(self.size // 8 + 1)
+        self.capacity = capacity
+        self.error_rate = error_rate
+
+    def _positions(self, item: str):
+        digest = hashlib.sha256(item.encode("UTF-8")).digest()
+        first = int.from_bytes(digest[:8], "big")
+        second = int.from_bytes(digest[8:16], "big") | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+
+    def add(self, item: str) -> None:
+        for pos in self._positions(item):
+            self.bits[pos // 8] |= 1 << (pos % 8)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[pos // 8] & (1 << (pos % 8))
+                   for pos in self._positions(item))
+
+
+class CrawlFrontier:
+    ''' Queue of urls to crawl that never hands out the same url twice '''
+
+    def __init__(self, max_depth: int, allowed_hosts=None):
+        self.max_depth = max_depth
+        self.allowed_hosts = set(allowed_hosts or [])
+        self.queue = deque()                # (url, depth) pairs to fetch
+        self.seen = set()                   # normalized urls ever queued
+        self.bloom = None                   # replaces seen on large crawls
+        self.pages_saved = 0
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+    def _is_seen(self, url: str) -> bool:
+        if self.bloom is not None:
+            return url in self.bloom
+        return url in self.seen
+
+    def _mark_seen(self, url: str) -> None:
+        if self.bloom is not None:
+            self.bloom.add(url)
+            return
+        self.seen.add(url)
+        # a set of strings grows without bound, so trade exactness for a
+        # fixed memory footprint once the crawl gets large
+        if len(self.seen) > BLOOM_THRESHOLD:
+            self.bloom = BloomFilter(BLOOM_THRESHOLD * 10)
+            for seen_url in self.seen:
+                self.bloom.add(seen_url)
+            self.seen = set()
+
+    def add(self, url: str, depth: int) -> bool:
+        ''' Queue a url unless it is out of scope or already queued '''
+        if not url.startswith(("http://", "https://")) or \
+                depth > self.max_depth:
+            return False
+        try:
+            url = normalize_url(url)
+        except ValueError:
+            return False                    # malformed url
+        if self.allowed_hosts and url_host(url) not in self.allowed_hosts:
+            return False
+        if urlsplit(url).path.lower().endswith(SKIPPED_EXTENSIONS):
+            return False
+        if self._is_seen(url):
+            return False
+        self._mark_seen(url)
+        self.queue.append((url, depth))
+        return True
+
+    def pop(self):
+        return self.queue.popleft()
+
+    def save(self, path: str) -> None:
+        ''' Write the frontier to disk so the crawl can be resumed '''
+        state = {
+            "max_depth": self.max_depth,
+            "allowed_hosts": sorted(self.allowed_hosts),
+            "queue": list(self.queue),
+            "seen": sorted(self.seen),
+            "pages_saved": self.pages_saved,
+            "bloom": None,
+        }
+        if self.bloom is not None:
+            state["bloom"] = {
+                "capacity": self.bloom.capacity,
+                "error_rate": self.bloom.error_rate,
+                "bits": base64.b64encode(bytes(self.bloom.bits)).decode(),
+            }
+        # write to a temporary file first so a crash never leaves a
+        # half written checkpoint behind
+        with open(path + ".tmp", "w", encoding='UTF-8') as checkpoint:
+            json.dump(state, checkpoint)
+        os.replace(path + ".tmp", path)
+
+    @classmethod
+    def load(cls, path: str):
+        ''' Rebuild a frontier from a checkpoint written by save '''
+        with open(path, encoding='UTF-8') as checkpoint:
+            state = json.load(checkpoint)
+        frontier = cls(state["max_depth"], state["allowed_hosts"])
+        frontier.queue = deque(tuple(item) for item in state["queue"])
+        frontier.seen = set(state["seen"])
+        frontier.pages_saved = state["pages_saved"]
+        if state["bloom"] is not None:
+            frontier.bloom = BloomFilter(
+                state["bloom"]["capacity"], state["bloom"]["error_rate"],
+                base64.b64decode(state["bloom"]["bits"]))
+        return frontier
+
+
+class PolitenessScheduler:
+    ''' Enforce robots.txt rules and a delay between hits on each host '''
+
+    def __init__(self, delay: float = CRAWL_DELAY, user_agent: str = "*"):
+        self.delay = delay
+        self.user_agent = user_agent
+        self.last_visit = {}                # host -> time of the last request
+        self.robots = {}                    # host -> parsed robots.txt
+
+    def _robots_for(self, url: str) -> RobotFileParser:
+        parts = urlsplit(url)
+        if parts.netloc not in self.robots:
+            robots_url = f"{parts.scheme}://{parts.netloc}/robots.txt"
+            parser = RobotFileParser(robots_url)
+            try:
+                response = requests.get(robots_url, timeout=REQUEST_TIMEOUT)
+                if response.status_code in (401, 403):
+                    parser.disallow_all = True
+                elif response.ok:
+                    parser.parse(response.text.splitlines())
+                else:
+                    parser.allow_all = True
+            except requests.RequestException:
+                parser.allow_all = True     # no robots.txt means no rules
+            self.robots[parts.netloc] = parser
+        return self.robots[parts.netloc]
+
+    def allowed(self, url: str) -> bool:
+        return self._robots_for(url).can_fetch(self.user_agent, url)
+
+    def wait(self, url: str) -> None:
+        ''' Sleep until the host of the url may be requested again '''
+        host = urlsplit(url).netloc
+        delay = max(self.delay,
+                    self._robots_for(url).crawl_delay(self.user_agent) or 0)
+        elapsed = time.monotonic() - self.last_visit.get(host, float("-inf"))
+        if elapsed < delay:
+            time.sleep(delay - elapsed)
+        self.last_visit[host] = time.monotonic()
+
+
+def crawl(seeds: list, directory: str, max_depth: int = 1,
+          same_domain: bool = True, delay: float = CRAWL_DELAY,
+          store: PageStore = None) -> int:
+    ''' Save every page reachable from the seed urls within max_depth links
+
+    The frontier is checkpointed to the directory, so calling crawl again
+    without seeds after an interruption picks up where the previous run
+    stopped. A new crawl is refused while an interrupted one is pending.
+    Returns the number of pages saved so far.
+    '''
+    checkpoint_path = os.path.join(directory, CHECKPOINT_FILE)
+    if os.path.exists(checkpoint_path):
+        if seeds:
+            print("An interrupted crawl is pending, enter crawl to resume it "
+                  "or crawl discard to start over")
+            return 0
+        frontier = CrawlFrontier.load(checkpoint_path)
+        print(f"Resuming crawl with {len(frontier)} pages in the frontier")
+    else:
+        frontier = CrawlFrontier(max_depth)
+    store = store if store is not None else PageStore(directory)
+    seeds = [seed if seed.startswith(("http://", "https://"))
+             else "http://" + seed for seed in seeds]
+    if same_domain:
+        frontier.allowed_hosts.update(url_host(seed) for seed in seeds)
+    for seed in seeds:
+        frontier.add(seed, 0)
+    frontier.save(checkpoint_path)          # resumable from the start
+
+    scheduler = PolitenessScheduler(delay)
+    pages_since_checkpoint = 0
+    current = None                          # url being processed, if any
+    try:
+        while frontier:
+            current = url, depth = frontier.pop()
+            if not scheduler.allowed(url):
+                current = None
+                continue                    # blocked by robots.txt
+            scheduler.wait(url)
+            hrefs = []
+            try:
+                page_text = web_scrape(url, hrefs, echo=False)
+            except requests.RequestException:
+                print(f"Could not fetch {url}")
+                current = None
+                continue
+            if page_text:
+                store.add(url, page_text)
+                frontier.pages_saved += 1
+                print(f"Page saved: {url}")
+            for href in hrefs:
+                frontier.add(href, depth + 1)
+            current = None
+
+            pages_since_checkpoint += 1
+            if pages_since_checkpoint >= CHECKPOINT_INTERVAL:
+                frontier.save(checkpoint_path)
+                pages_since_checkpoint = 0
+    except KeyboardInterrupt:
+        # put back the page that was cut short so the resumed crawl
+        # fetches it and follows its links
+        if current is not None:
+            frontier.queue.appendleft(current)
+        frontier.save(checkpoint_path)
+        print("Crawl interrupted, enter crawl to resume")
+        return frontier.pages_saved
+    except BaseException:
+        # keep the progress made so far, but leave out the page that
+        # failed so that resuming does not hit the same error again
+        frontier.save(checkpoint_path)
+        print("Crawl failed, enter crawl to resume")
+        raise
+
+    # the crawl is complete, so there is nothing left to resume
+    if os.path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    print(f"Crawl complete: {frontier.pages_saved} pages saved")
+    return frontier.pages_saved
+
+
 def url_tabs(user_input: str, directory: str) -> None:
     ''' Save the webpage ( url ) to the directory and print to stdout '''
     news_queue = deque()                    # create a queue to store tabs
     pages_removed_from_queue = []           # storage for the popped items
+    store = PageStore(directory)            # archive of the saved pages
 
     while user_input != "exit":
         # Simulate the back button on a browser with a "back" command. Note
@@ -89,6 +612,43 @@ def url_tabs(user_input: str, directory: str) -> None:
                 # print the previous page
                 print(prev_saved_page)
                 pages_removed_from_queue.append(prev_saved_page)
+        elif user_input.split(" ")[0] == "crawl":
+            # crawl [--any-domain] <depth> <url> [<url> ...], a bare crawl
+            # to resume or crawl discard to drop an interrupted crawl
+            crawl_args = user_input.split()[1:]
+            checkpoint_path = os.path.join(directory, CHECKPOINT_FILE)
+            if crawl_args == ["discard"]:
+                if os.path.exists(checkpoint_path):
+                    os.remove(checkpoint_path)
+                    print("Interrupted crawl discarded")
+                else:
+                    print("No interrupted crawl to discard")
+            else:
+                same_domain = "--any-domain" not in crawl_args
+                crawl_args = [arg for arg in crawl_args
+                              if arg != "--any-domain"]
+                depth = 1
+                if crawl_args and crawl_args[0].isdigit():
+                    depth = int(crawl_args.pop(0))
+                if crawl_args or os.path.exists(checkpoint_path):
+                    crawl(crawl_args, directory, depth, same_domain,
+                          store=store)
+                else:
+                    print("Usage: crawl [--any-domain] <depth> "
+                          "<url> [<url> ...]")
+        elif user_input == "compact":
+            store.compact()                 # drop the old copies of pages
+            print("Archive compacted")
+        elif user_input.split(" ")[0] == "search":
+            # list the saved pages that contain the words or phrases
+            query = user_input[len("search"):].strip()
+            if query:
+                results = store.search(query)
+                for result in results:
+                    print(result)
+                print(f"{len(results)} pages found")
+            else:
+                print('Usage: search <words or "a phrase">')
         else:
             for _ in range(len(pages_removed_from_queue)):
                 news_queue.append(pages_removed_from_queue.pop())
@@ -118,12 +678,9 @@ def url_tabs(user_input: str, directory: str) -> None:
             page_text = web_scrape(url)      # extract the text from the page
             print(page_text)                 # print the text to stdout
             # save page content to file
-            filename = url[7:].rpartition(".")[0].replace(".", "_")
-            with open(directory + "/" + filename, "w",
-                      encoding='UTF-8') as text_file:
-                text_file.write(page_text)
+            store.add(url, page_text)
             # task complete message
-            print(f"Page saved to file {filename}")
+            print(f"Page saved: {url}")
         # Prompt the user to enter a new url
         user_input = input()
 